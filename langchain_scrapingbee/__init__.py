@@ -1,6 +1,6 @@
 from importlib import metadata
 
-from langchain_scrapingbee.tools import ScrapeUrlTool, GoogleSearchTool, CheckUsageTool
+from langchain_scrapingbee.tools import ScrapeUrlTool, GoogleSearchTool, CheckUsageTool, aclose
 
 try:
     __version__ = metadata.version(__package__)
@@ -13,4 +13,5 @@ __all__ = [
     "ScrapeUrlTool",
     "GoogleSearchTool",
     "CheckUsageTool",
+    "aclose",
 ]
@@ -1,11 +1,36 @@
+import os
 from typing import Type
 import requests
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+import asyncio
+import json
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
 from langchain_tests.unit_tests import ToolsUnitTests
 
 # Import your tools
-from langchain_scrapingbee.tools import ScrapeUrlTool, GoogleSearchTool, CheckUsageTool
+from langchain_scrapingbee.tools import (
+    ScrapeUrlTool, GoogleSearchTool, CheckUsageTool, DiskBackend, MemoryBackend, _USAGE_CACHE, _warm_up_session
+)
+
+
+@pytest.fixture(autouse=True)
+def no_warm_up():
+    """Keep tool construction from starting the background warm-up request"""
+    with patch('langchain_scrapingbee.tools._warm_up_session') as mock_warm_up:
+        yield mock_warm_up
+
+
+@pytest.fixture
+def tool_mocks():
+    """The sync and async sessions the tools call, patched once per test, and a backend that keeps results in memory"""
+    with patch('langchain_scrapingbee.tools._SESSION.get') as mock_get, \
+         patch('langchain_scrapingbee.tools._get_aio_session') as mock_get_aio_session:
+        aio_session = MagicMock()
+        mock_get_aio_session.return_value = (aio_session, asyncio.Semaphore(1))
+        yield SimpleNamespace(get=mock_get, aio_session=aio_session, backend=MemoryBackend())
 
 
 class TestScrapeUrlToolUnit(ToolsUnitTests):
@@ -31,22 +56,18 @@ class TestScrapeUrlToolUnit(ToolsUnitTests):
             "return_content": False
         }
 
-    @patch('langchain_scrapingbee.tools.requests.get')
-    @patch('langchain_scrapingbee.tools.create_results_folder')
-    @patch('langchain_scrapingbee.tools.save_scraping_metadata')
-    @patch('builtins.open', new_callable=mock_open)
-    def test_scrape_url_binary_content(self, mock_file, mock_save_metadata, mock_create_folder, mock_requests_get):
+    def test_scrape_url_binary_content(self, tool_mocks):
         """Test binary content handling (screenshots)"""
         # Setup mocks
         mock_response = Mock()
-        mock_response.content = b'fake_png_data'
+        mock_response.iter_content.return_value = [b'fake_png_', b'data']
         mock_response.headers = {'Content-Type': 'image/png'}
         mock_response.raise_for_status.return_value = None
-        mock_requests_get.return_value = mock_response
-        mock_create_folder.return_value = '/tmp/test_folder'
+        tool_mocks.get.return_value = mock_response
 
         # Create tool instance
-        tool = self.tool_constructor(**self.tool_constructor_params)
+        backend = tool_mocks.backend
+        tool = self.tool_constructor(backend=backend, **self.tool_constructor_params)
         
         # Test binary content
         result = tool._run(
@@ -55,26 +76,28 @@ class TestScrapeUrlToolUnit(ToolsUnitTests):
         )
         
         assert "Binary content saved successfully" in result
-        mock_requests_get.assert_called_once()
-        mock_file.assert_called_once()
-        mock_save_metadata.assert_called_once()
-
-    @patch('langchain_scrapingbee.tools.requests.get')
-    @patch('langchain_scrapingbee.tools.create_results_folder')
-    @patch('langchain_scrapingbee.tools.save_scraping_metadata')
-    @patch('builtins.open', new_callable=mock_open, read_data='<html><body>Test content</body></html>')
-    def test_scrape_url_text_content(self, mock_file, mock_save_metadata, mock_create_folder, mock_requests_get):
+        assert "Size: 13 bytes" in result
+        assert tool_mocks.get.call_args.kwargs["stream"] is True
+        assert tool_mocks.get.call_args.kwargs["params"][:3] == [
+            ("api_key", "test_api_key"), ("url", "https://example.com"), ("screenshot", True)
+        ]
+        tool_mocks.get.assert_called_once()
+        (folder,) = backend.folders
+        assert backend.files == {os.path.join(folder, "example.com.png"): b'fake_png_data'}
+        assert [r["result_type"] for r in backend.metadata[folder]] == ["binary"]
+
+    def test_scrape_url_text_content(self, tool_mocks):
         """Test text content handling"""
         # Setup mocks
         mock_response = Mock()
         mock_response.text = '<html><body>Test content</body></html>'
         mock_response.headers = {'Content-Type': 'text/html'}
         mock_response.raise_for_status.return_value = None
-        mock_requests_get.return_value = mock_response
-        mock_create_folder.return_value = '/tmp/test_folder'
+        tool_mocks.get.return_value = mock_response
 
         # Create tool instance
-        tool = self.tool_constructor(**self.tool_constructor_params)
+        backend = tool_mocks.backend
+        tool = self.tool_constructor(backend=backend, **self.tool_constructor_params)
         
         # Test text content
         result = tool._run(
@@ -85,8 +108,135 @@ class TestScrapeUrlToolUnit(ToolsUnitTests):
         
         assert "Text content saved and loaded" in result
         assert "Test content" in result
-        mock_file.assert_called()
-        mock_save_metadata.assert_called_once()
+        assert tool_mocks.get.call_args.args[0] == "https://app.scrapingbee.com/api/v1/"
+        assert dict(tool_mocks.get.call_args.kwargs["params"])["url"] == "https://example.com"
+        assert result.endswith("CONTENT:\n<html><body>Test content</body></html>")
+        assert "\n " not in result  # no indentation leaking into the agent's context
+        (folder,) = backend.folders
+        assert backend.files == {os.path.join(folder, "example.com.html"): b'<html><body>Test content</body></html>'}
+        assert [r["result_type"] for r in backend.metadata[folder]] == ["text"]
+
+    def test_scrape_url_text_streamed(self, tool_mocks):
+        """Test text content is streamed to disk when it isn't returned"""
+        # Setup mocks
+        mock_response = Mock()
+        mock_response.encoding = None
+        mock_response.iter_content.return_value = ['<html><body>', 'Test content</body></html>']
+        mock_response.headers = {'Content-Type': 'text/html'}
+        mock_response.raise_for_status.return_value = None
+        tool_mocks.get.return_value = mock_response
+
+        # Create tool instance
+        backend = tool_mocks.backend
+        tool = self.tool_constructor(backend=backend, **self.tool_constructor_params)
+        
+        # Test text content
+        result = tool._run(url="https://example.com")
+        
+        assert "Text content saved successfully" in result
+        assert "Size: 38 characters" in result
+        assert mock_response.encoding == 'utf-8'
+        mock_response.iter_content.assert_called_once_with(chunk_size=65536, decode_unicode=True)
+        mock_response.close.assert_called_once()
+        assert list(backend.files.values()) == [b'<html><body>Test content</body></html>']
+
+    def test_scrape_url_without_saving(self, tool_mocks):
+        """Test text content is returned without touching the disk when save_to_disk is False"""
+        # Setup mocks
+        mock_response = Mock()
+        mock_response.text = '<html><body>Test content</body></html>'
+        mock_response.headers = {'Content-Type': 'text/html'}
+        mock_response.raise_for_status.return_value = None
+        tool_mocks.get.return_value = mock_response
+
+        # Create tool instance
+        backend = tool_mocks.backend
+        tool = self.tool_constructor(backend=backend, **self.tool_constructor_params)
+        
+        # Test text content
+        result = tool._run(url="https://example.com", save_to_disk=False)
+        
+        assert "Text content loaded" in result
+        assert "Test content" in result
+        assert not backend.folders
+        assert not backend.files
+        assert not backend.metadata
+
+    def test_scrape_url_error_body(self, tool_mocks):
+        """Test the API's error message is read before the streamed response is closed"""
+        mock_response = Mock()
+        mock_response.ok = False
+        mock_response.close.side_effect = lambda: setattr(mock_response, 'text', '')
+        mock_response.text = '{"message": "Invalid api key"}'
+        tool_mocks.get.return_value = mock_response
+
+        tool = self.tool_constructor(backend=tool_mocks.backend, **self.tool_constructor_params)
+        result = tool._run(url="https://example.com")
+        
+        assert result == 'Error: Request failed. Details: {"message": "Invalid api key"}'
+        mock_response.close.assert_called_once()
+        assert not tool_mocks.backend.folders
+
+    async def test_scrape_url_async(self, tool_mocks):
+        """Test the async path shares the request assembly and saving logic"""
+        # Setup mocks
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.headers = {'Content-Type': 'text/html'}
+        mock_response.text = AsyncMock(return_value='<html><body>Async content</body></html>')
+        mock_session = tool_mocks.aio_session
+        mock_session.get.return_value.__aenter__.return_value = mock_response
+
+        # Create tool instance
+        backend = tool_mocks.backend
+        tool = self.tool_constructor(backend=backend, **self.tool_constructor_params)
+        
+        # Test async text content
+        result = await tool._arun(
+            url="https://example.com",
+            params={"render_js": False, "extract_rules": {"title": "h1"}},
+            headers={"Accept-Language": "en"},
+            return_content=True
+        )
+        
+        assert "Text content saved and loaded" in result
+        assert "Async content" in result
+        query = dict(mock_session.get.call_args.kwargs["params"])
+        assert query["render_js"] == "false"
+        assert query["forward_headers"] == "true"
+        assert query["extract_rules"] == '{"title":"h1"}'
+        assert mock_session.get.call_args.kwargs["headers"] == {"Spb-Accept-Language": "en"}
+        (folder,) = backend.folders
+        assert backend.files == {os.path.join(folder, "example.com.html"): b'<html><body>Async content</body></html>'}
+
+    def test_scrape_url_large_body_streamed(self, tool_mocks, tmp_path):
+        """Test a multi-MiB body is streamed to disk without ever being held in memory"""
+        import tracemalloc
+        chunk_size, chunk_count = 65536, 256
+
+        def body():
+            for _ in range(chunk_count):
+                yield 'x' * chunk_size
+
+        mock_response = Mock()
+        mock_response.encoding = None
+        mock_response.iter_content.return_value = body()
+        mock_response.headers = {'Content-Type': 'text/html'}
+        tool_mocks.get.return_value = mock_response
+
+        tool = self.tool_constructor(backend=DiskBackend(), **self.tool_constructor_params)
+        tracemalloc.start()
+        try:
+            result = tool._run(url="https://example.com", results_folder=str(tmp_path))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert f"Size: {chunk_size * chunk_count:,} characters" in result
+        (saved,) = tmp_path.glob("*/example.com.html")
+        assert saved.stat().st_size == chunk_size * chunk_count
+        # Bounded by a few chunks and the write buffer, not the 16 MiB body
+        assert peak < 4 * 1024 * 1024
 
 
 class TestGoogleSearchToolUnit(ToolsUnitTests):
@@ -110,43 +260,40 @@ class TestGoogleSearchToolUnit(ToolsUnitTests):
             "return_content": False
         }
 
-    @patch('langchain_scrapingbee.tools.requests.get')
-    @patch('langchain_scrapingbee.tools.create_results_folder')
-    @patch('langchain_scrapingbee.tools.save_scraping_metadata')
-    @patch('builtins.open', new_callable=mock_open)
-    def test_google_search_regular(self, mock_file, mock_save_metadata, mock_create_folder, mock_requests_get):
+    def test_google_search_regular(self, tool_mocks):
         """Test regular web search functionality"""
         # Setup mocks
         mock_response = Mock()
-        mock_response.text = '{"organic_results": [{"title": "Test", "url": "https://test.com"}]}'
+        mock_response.content = b'{"organic_results": [{"title": "Test", "url": "https://test.com"}]}'
         mock_response.raise_for_status.return_value = None
-        mock_requests_get.return_value = mock_response
-        mock_create_folder.return_value = '/tmp/test_folder'
+        tool_mocks.get.return_value = mock_response
 
         # Create tool instance
-        tool = self.tool_constructor(**self.tool_constructor_params)
+        backend = tool_mocks.backend
+        tool = self.tool_constructor(backend=backend, **self.tool_constructor_params)
         
         # Test regular search
         result = tool._run(
             search="test query",
-            params={"search_type": "classic"}
+            params={"search_type": "classic"},
+            return_content=True
         )
         
         assert "Search complete" in result
         assert "classic" in result  # Changed from "web" to "classic" to match the actual search_type
-        mock_file.assert_called()
-        mock_save_metadata.assert_called_once()
-
-    @patch('langchain_scrapingbee.tools.requests.get')
-    @patch('langchain_scrapingbee.tools.create_results_folder')
-    @patch('langchain_scrapingbee.tools.save_scraping_metadata')
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('os.makedirs')
-    def test_google_search_images(self, mock_makedirs, mock_file, mock_save_metadata, mock_create_folder, mock_requests_get):
+        assert "Results: 1" in result
+        assert tool_mocks.get.call_args.args[0] == "https://app.scrapingbee.com/api/v1/store/google"
+        assert tool_mocks.get.call_args.kwargs["params"]["search"] == "test query"
+        assert '"organic_results"' in result
+        (folder,) = backend.folders
+        assert backend.files == {os.path.join(folder, "classic_search_test_query.json"): mock_response.content}
+        assert [r["result_type"] for r in backend.metadata[folder]] == ["search_results"]
+
+    def test_google_search_images(self, tool_mocks):
         """Test image search functionality"""
         # Setup mocks
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "images": [
                 {
                     "image": "https://example.com/image1.jpg",
@@ -159,13 +306,13 @@ class TestGoogleSearchToolUnit(ToolsUnitTests):
                     "position": 2
                 }
             ]
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
-        mock_requests_get.return_value = mock_response
-        mock_create_folder.return_value = '/tmp/test_folder'
+        tool_mocks.get.return_value = mock_response
 
         # Create tool instance
-        tool = self.tool_constructor(**self.tool_constructor_params)
+        backend = tool_mocks.backend
+        tool = self.tool_constructor(backend=backend, **self.tool_constructor_params)
         
         # Test image search
         result = tool._run(
@@ -174,9 +321,159 @@ class TestGoogleSearchToolUnit(ToolsUnitTests):
         )
         
         assert "Image search complete" in result
-        mock_makedirs.assert_called()
-        mock_file.assert_called()
-        mock_save_metadata.assert_called_once()
+        assert "Saved 1 base64 images" in result
+        (folder,) = backend.folders
+        assert sorted(backend.files) == [
+            os.path.join(folder, name) for name in ("02_Test_Image_2.png", "image_links.txt", "image_search_test_images.json")
+        ]
+        assert backend.files[os.path.join(folder, "image_search_test_images.json")] == mock_response.content
+        assert len(backend.metadata[folder]) == 1
+
+    async def test_google_search_async(self, tool_mocks):
+        """Test the async search path reuses the shared session and result handlers"""
+        # Setup mocks
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.read = AsyncMock(return_value=b'{"news_results": [{"title": "A"}, {"title": "B"}]}')
+        mock_session = tool_mocks.aio_session
+        mock_session.get.return_value.__aenter__.return_value = mock_response
+
+        # Create tool instance
+        backend = tool_mocks.backend
+        tool = self.tool_constructor(backend=backend, **self.tool_constructor_params)
+        
+        # Test async news search
+        result = await tool._arun(search="test query", params={"search_type": "news", "nfpr": True, "extra": ["a", "b"]})
+        
+        assert "Search complete" in result
+        assert "Results: 2" in result
+        query = dict(mock_session.get.call_args.kwargs["params"])
+        assert query["search"] == "test query"
+        assert query["nfpr"] == "true"
+        # Lists are sent as repeated keys, as the sync path does through requests
+        params = mock_session.get.call_args.kwargs["params"]
+        assert [value for key, value in params if key == "extra"] == ["a", "b"]
+        (folder,) = backend.folders
+        assert backend.files == {os.path.join(folder, "news_search_test_query.json"): mock_response.read.return_value}
+
+    def test_google_search_unparseable_count(self, tool_mocks):
+        """Test the result count degrades to unknown for bodies that aren't a search response"""
+        tool = self.tool_constructor(backend=tool_mocks.backend, **self.tool_constructor_params)
+        
+        for body in (b'not json', b'[1, 2, 3]', b'{"organic_results": 5}'):
+            result = tool._handle_regular_search(body, "test query", {}, "search_results", False)
+            assert "Results: unknown" in result
+
+    def test_google_search_images_not_downloaded(self, tool_mocks):
+        """Test URL image results are listed, not fetched, and base64 ones are decoded inline"""
+        png = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="
+        images = [{"image": f"https://example.com/image{i}.jpg", "title": f"Link {i}", "position": i} for i in range(10)]
+        images += [{"image": png, "title": f"Inline {i}", "position": 10 + i} for i in range(3)]
+        mock_response = Mock()
+        mock_response.content = json.dumps({"images": images}).encode()
+        mock_response.raise_for_status.return_value = None
+        tool_mocks.get.return_value = mock_response
+
+        backend = tool_mocks.backend
+        tool = self.tool_constructor(backend=backend, **self.tool_constructor_params)
+        with patch('langchain_scrapingbee.tools.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+            result = tool._run(search="test images", params={"search_type": "images"})
+        
+        assert "Saved 3 base64 images" in result
+        assert "Saved 10 image links" in result
+        # Only the search itself hits the network, and only the base64 images go to the pool
+        tool_mocks.get.assert_called_once()
+        mock_executor.assert_called_once_with(max_workers=3)
+        (folder,) = backend.folders
+        assert sorted(os.path.basename(path) for path in backend.files) == [
+            "10_Inline_0.png", "11_Inline_1.png", "12_Inline_2.png", "image_links.txt", "image_search_test_images.json"
+        ]
+        assert backend.files[os.path.join(folder, "image_search_test_images.json")] == mock_response.content
+
+    def test_google_search_image_links_skip_pool(self, tool_mocks):
+        """Test URL-only image results are listed without starting the decoding pool"""
+        images = [{"image": f"https://example.com/image{i}.jpg", "title": f"Link {i}", "position": i} for i in range(5)]
+        tool_mocks.get.return_value.content = json.dumps({"images": images}).encode()
+        
+        tool = self.tool_constructor(backend=tool_mocks.backend, **self.tool_constructor_params)
+        with patch('langchain_scrapingbee.tools.ThreadPoolExecutor') as mock_executor:
+            result = tool._run(search="test images", params={"search_type": "images"})
+        
+        assert "Saved 0 base64 images" in result
+        assert "Saved 5 image links" in result
+        mock_executor.assert_not_called()
+
+    def test_google_search_images_decoded_concurrently(self, tool_mocks):
+        """Test a batch of inline images is decoded on the thread pool and every image is saved"""
+        png = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="
+        images = [{"image": png, "title": f"Inline {i}", "position": i} for i in range(1, 21)]
+        mock_response = Mock()
+        mock_response.content = json.dumps({"images": images}).encode()
+        mock_response.raise_for_status.return_value = None
+        tool_mocks.get.return_value = mock_response
+
+        backend = tool_mocks.backend
+        tool = self.tool_constructor(backend=backend, **self.tool_constructor_params)
+        with patch('langchain_scrapingbee.tools.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+            result = tool._run(search="test images", params={"search_type": "images"})
+        
+        assert "Saved 20 base64 images" in result
+        mock_executor.assert_called_once_with(max_workers=16)
+        saved = sorted(path for path in backend.files if path.endswith(".png"))
+        assert [os.path.basename(path) for path in saved] == [f"{i:02d}_Inline_{i}.png" for i in range(1, 21)]
+        assert len({backend.files[path] for path in saved}) == 1
+
+    def test_is_base64_image(self):
+        """Test base64 detection sniffs the image signature instead of decoding everything"""
+        tool = self.tool_constructor(**self.tool_constructor_params)
+        png = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="
+        
+        assert tool._is_base64_image(png)
+        assert tool._is_base64_image("data:image/png;base64," + png)
+        assert tool._is_base64_image("iVBORw0K\nGgoAAAAN\r\n SUhEUgAA" + png[24:])
+        assert not tool._is_base64_image("https://example.com/image1.jpg")
+        assert not tool._is_base64_image("//cdn.example.com/image1.jpg")
+        assert not tool._is_base64_image("/images/image1.jpg")
+        assert not tool._is_base64_image("iVBORw0KGgo=")  # PNG signature, but far too short to be an image
+        assert not tool._is_base64_image("aGVsbG8gd29ybGQgdGhpcyBpcyBub3QgYW4gaW1hZ2U=")
+
+    def test_save_base64_image_detects_format(self, tmp_path):
+        """Test the saved file extension comes from the decoded image signature"""
+        import base64
+        tool = self.tool_constructor(**self.tool_constructor_params)
+        samples = {
+            "png": b'\x89PNG\r\n\x1a\n' + b'\x00' * 16,
+            "gif": b'GIF89a' + b'\x00' * 16,
+            "webp": b'RIFF\x10\x00\x00\x00WEBPVP8 ' + b'\x00' * 16,
+            "jpg": b'\xff\xd8\xff\xe0' + b'\x00' * 16,
+        }
+        
+        for i, (expected, image_bytes) in enumerate(samples.items()):
+            result = tool._save_base64_image(base64.b64encode(image_bytes).decode(), str(tmp_path), f"{i:02d}", expected)
+            assert result == f"Saved: {tmp_path / f'{i:02d}_{expected}.{expected}'}"
+        
+        # A non-WEBP RIFF file (e.g. WAV) that merely contains b'WEBP' later on is not a WEBP image
+        wav = b'RIFF\x10\x00\x00\x00WAVEfmt ' + b'WEBP' * 4
+        result = tool._save_base64_image(base64.b64encode(wav).decode(), str(tmp_path), "09", "riff")
+        assert result.endswith("09_riff.jpg")
+
+    def test_save_image_links(self, tmp_path):
+        """Test image links are written as one numbered list"""
+        tool = self.tool_constructor(**self.tool_constructor_params)
+        links = [
+            {"url": "https://example.com/a.jpg", "title": "A", "position": 1},
+            {"url": "https://example.com/b.jpg", "title": "B", "position": 2},
+        ]
+        
+        result = tool._save_image_links(links, str(tmp_path))
+        
+        assert result == f"Saved 2 image links to: {tmp_path / 'image_links.txt'}"
+        content = (tmp_path / "image_links.txt").read_text(encoding="utf-8")
+        assert content.startswith("# Image Links from Google Search\n# Generated: ")
+        assert content.endswith(
+            "1. Title: A\n   URL: https://example.com/a.jpg\n   Position: 1\n\n"
+            "2. Title: B\n   URL: https://example.com/b.jpg\n   Position: 2\n\n"
+        )
 
 
 class TestCheckUsageToolUnit(ToolsUnitTests):
@@ -196,14 +493,20 @@ class TestCheckUsageToolUnit(ToolsUnitTests):
         """
         return {}
 
-    @patch('langchain_scrapingbee.tools.requests.get')
-    def test_check_usage_success(self, mock_requests_get):
+    @pytest.fixture(autouse=True)
+    def clear_usage_cache(self):
+        """Keep cached usage responses from leaking between tests"""
+        _USAGE_CACHE.clear()
+        yield
+        _USAGE_CACHE.clear()
+
+    def test_check_usage_success(self, tool_mocks):
         """Test successful usage check"""
         # Setup mocks
         mock_response = Mock()
         mock_response.text = '{"used_credits": 100, "remaining_credits": 900}'
         mock_response.raise_for_status.return_value = None
-        mock_requests_get.return_value = mock_response
+        tool_mocks.get.return_value = mock_response
 
         # Create tool instance
         tool = self.tool_constructor(**self.tool_constructor_params)
@@ -213,9 +516,30 @@ class TestCheckUsageToolUnit(ToolsUnitTests):
         
         assert "used_credits" in result
         assert "remaining_credits" in result
+        
+        # A repeated check from the same agent loop is answered from the cache
+        assert tool._run() == result
+        assert tool_mocks.get.call_count == 1
+
+    async def test_check_usage_async(self, tool_mocks):
+        """Test the async usage check returns the API response as-is"""
+        # Setup mocks
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.text = AsyncMock(return_value='{"used_credits": 100, "remaining_credits": 900}')
+        mock_session = tool_mocks.aio_session
+        mock_session.get.return_value.__aenter__.return_value = mock_response
 
-    @patch('langchain_scrapingbee.tools.requests.get')
-    def test_check_usage_error(self, mock_requests_get):
+        # Create tool instance
+        tool = self.tool_constructor(**self.tool_constructor_params)
+        
+        # Test async usage check
+        result = await tool._arun()
+        
+        assert "remaining_credits" in result
+        assert mock_session.get.call_args.kwargs["params"] == {"api_key": "test_api_key"}
+
+    def test_check_usage_error(self, tool_mocks):
         """Test error handling in usage check"""
         # Setup mock to raise an exception with a response attribute
         mock_response = Mock()
@@ -223,7 +547,7 @@ class TestCheckUsageToolUnit(ToolsUnitTests):
         
         mock_exception = requests.exceptions.RequestException("API Error")
         mock_exception.response = mock_response
-        mock_requests_get.side_effect = mock_exception
+        tool_mocks.get.side_effect = mock_exception
 
         # Create tool instance
         tool = self.tool_constructor(**self.tool_constructor_params)
@@ -233,6 +557,35 @@ class TestCheckUsageToolUnit(ToolsUnitTests):
         
         assert "Error checking usage" in result
 
+    def test_check_usage_cached(self, tool_mocks):
+        """Test repeated usage checks within cache_ttl reuse the last response"""
+        # Setup mocks
+        mock_response = Mock()
+        mock_response.text = '{"used_credits": 100, "remaining_credits": 900}'
+        mock_response.raise_for_status.return_value = None
+        tool_mocks.get.return_value = mock_response
+
+        # Create tool instances
+        tool = self.tool_constructor(**self.tool_constructor_params)
+        uncached_tool = self.tool_constructor(cache_ttl=0, **self.tool_constructor_params)
+        
+        assert tool._run() == tool._run()
+        tool_mocks.get.assert_called_once()
+        
+        uncached_tool._run()
+        assert tool_mocks.get.call_count == 2
+
+    def test_check_usage_cache_bounded(self, tool_mocks):
+        """Test the usage cache keeps only the most recently stored API keys"""
+        from langchain_scrapingbee.tools import _USAGE_CACHE_MAXSIZE
+        tool_mocks.get.return_value.text = '{"used_credits": 100, "remaining_credits": 900}'
+        
+        for i in range(_USAGE_CACHE_MAXSIZE + 5):
+            self.tool_constructor(api_key=f"key_{i}")._run()
+        
+        assert len(_USAGE_CACHE) == _USAGE_CACHE_MAXSIZE
+        assert "key_0" not in _USAGE_CACHE
+        assert f"key_{_USAGE_CACHE_MAXSIZE + 4}" in _USAGE_CACHE
 
 # Additional unit tests for utility functions
 class TestUtilityFunctions:
@@ -249,6 +602,9 @@ class TestUtilityFunctions:
         # Test with special characters
         result = sanitize_filename("https://test.com/file@#$%")
         assert result == "test.com_file____"
+        
+        # Non-ASCII word characters are kept, whitespace and dashes collapse
+        assert sanitize_filename("https://test.com/café - menu") == "test.com_café_menu"
     
     def test_stringify_nested_objects(self):
         """Test parameter stringification"""
@@ -257,14 +613,20 @@ class TestUtilityFunctions:
         params = {
             "simple": "value",
             "nested_dict": {"key": "value"},
-            "nested_list": [1, 2, 3]
+            "nested_list": [1, 2, 3],
+            "nested_tuple": ("a", "b")
         }
         
         result = stringify_nested_objects(params)
         
         assert result["simple"] == "value"
-        assert result["nested_dict"] == '{"key": "value"}'
-        assert result["nested_list"] == "[1, 2, 3]"
+        assert result["nested_dict"] == '{"key":"value"}'
+        assert result["nested_list"] == "[1,2,3]"
+        assert result["nested_tuple"] == '["a","b"]'
+        
+        # Params without nested values are passed through as-is
+        flat = {"render_js": False, "wait": 2000}
+        assert stringify_nested_objects(flat) is flat
     
     def test_str_to_dict_validator(self):
         """Test string to dictionary validation"""
@@ -284,4 +646,241 @@ class TestUtilityFunctions:
         
         # Test Python dict literal
         result = str_to_dict_validator("{'key': True}")
-        assert result == {"key": True}
\ No newline at end of file
+        assert result == {"key": True}
+        
+        # JSON containing '=' isn't mistaken for URL parameters
+        result = str_to_dict_validator(' {"js_scenario": "a=b&c=d"}')
+        assert result == {"js_scenario": "a=b&c=d"}
+
+    def test_create_pooled_session(self):
+        """Test the shared session pools connections and sets the default User-Agent"""
+        from langchain_scrapingbee.tools import create_pooled_session
+        
+        session = create_pooled_session()
+        adapter = session.get_adapter("https://app.scrapingbee.com/api/v1/")
+        
+        assert session.headers["User-Agent"] == "LangChain"
+        assert adapter._pool_maxsize == 64
+        assert adapter.max_retries.total == 2
+        
+        # Every tool shares the module-level session
+        from langchain_scrapingbee.tools import _SESSION
+        shared_adapter = _SESSION.get_adapter("https://app.scrapingbee.com/api/v1/store/google")
+        assert shared_adapter._pool_maxsize == 100
+
+    def test_aio_session_closed_with_its_loop(self):
+        """Test each event loop gets its own async session, closed before the loop is"""
+        import gc
+        import warnings
+
+        from langchain_scrapingbee import tools
+        
+        async def get_session():
+            session, _ = await tools._get_aio_session()
+            assert (await tools._get_aio_session())[0] is session
+            return session
+        
+        async def get_and_close():
+            session = await get_session()
+            await tools.aclose()
+            return session
+        
+        gc.collect()
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            first = asyncio.run(get_session())
+            second = asyncio.run(get_and_close())
+            # A loop closed without shutting down its async generators leaves its session
+            # behind until the next one is opened
+            loop = asyncio.new_event_loop()
+            stale = loop.run_until_complete(get_session())
+            loop.close()
+            assert not stale.closed
+            last = asyncio.run(get_session())
+            del first, second, stale, last
+            gc.collect()
+        
+        assert not tools._aio_sessions
+        # asyncio.run replaces the loop pytest-asyncio left current, which may be collected here too
+        leaks = [str(w.message) for w in caught if issubclass(w.category, ResourceWarning)]
+        assert not [message for message in leaks if "event loop" not in message]
+
+    def test_str_to_dict_validator_cached_copies(self):
+        """Test repeated dict literals are evaluated once but never share a dict"""
+        from langchain_scrapingbee.tools import _parse_literal, str_to_dict_validator
+        
+        _parse_literal.cache_clear()
+        first = str_to_dict_validator("{'extract_rules': {'title': 'h1'}}")
+        first["extract_rules"]["link"] = "a"
+        second = str_to_dict_validator("{'extract_rules': {'title': 'h1'}}")
+        
+        assert second == {"extract_rules": {"title": "h1"}}
+        assert _parse_literal.cache_info().hits == 1
+        # JSON and URL parameters are cheaper to parse again than to copy, so they skip the cache
+        str_to_dict_validator('{"screenshot_full_page": true}')
+        str_to_dict_validator('screenshot=true&wait=2000')
+        assert _parse_literal.cache_info().currsize == 1
+
+    def test_params_keep_stdlib_json_semantics(self):
+        """Test params parse and serialize like stdlib json even when orjson is installed"""
+        from langchain_scrapingbee.tools import (
+            ScrapeUrlInput,
+            str_to_dict_validator,
+            stringify_nested_objects,
+        )
+        
+        big = 99999999999999999999
+        assert ScrapeUrlInput(url="https://example.com", params=f"session_id={big}").params == {"session_id": big}
+        assert ScrapeUrlInput(url="https://example.com", params=f'{{"session_id": {big}}}').params == {"session_id": big}
+        assert str_to_dict_validator("{1: 'h1'}") == {1: "h1"}
+        assert stringify_nested_objects({"extract_rules": {1: "h1"}, "nan": [float("nan")]}) == {
+            "extract_rules": '{"1":"h1"}', "nan": "[NaN]"
+        }
+
+    def test_save_scraping_metadata_appends(self, tmp_path):
+        """Test metadata records are appended to one jsonl file per folder"""
+        from langchain_scrapingbee.tools import save_scraping_metadata
+        
+        save_scraping_metadata(str(tmp_path), "https://example.com/a", {}, "text", filename="a.html")
+        metadata_file = save_scraping_metadata(str(tmp_path), "https://example.com/b", {"wait": 1}, "binary", filename="b.png")
+        
+        with open(metadata_file, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        
+        assert [r["url"] for r in records] == ["https://example.com/a", "https://example.com/b"]
+        assert records[1]["params"] == {"wait": 1}
+
+    def test_save_scraping_metadata_recreated_folder(self, tmp_path):
+        """Test records go to the folder currently at the path after it's deleted and recreated"""
+        import shutil
+
+        from langchain_scrapingbee.tools import save_scraping_metadata
+        
+        folder = tmp_path / "run"
+        folder.mkdir()
+        save_scraping_metadata(str(folder), "https://example.com/a", {}, "text")
+        shutil.rmtree(folder)
+        folder.mkdir()
+        metadata_file = save_scraping_metadata(str(folder), "https://example.com/b", {}, "text")
+        
+        with open(metadata_file, encoding="utf-8") as f:
+            assert [json.loads(line)["url"] for line in f] == ["https://example.com/b"]
+
+    def test_write_chunks_is_atomic(self, tmp_path):
+        """Test a failed stream leaves neither a partial result nor its .part file behind"""
+        def broken_stream():
+            yield b'first chunk'
+            raise requests.exceptions.ChunkedEncodingError("connection reset")
+        
+        backend = DiskBackend()
+        file_path = str(tmp_path / "page.png")
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            backend.write_stream(file_path, broken_stream())
+        assert os.listdir(tmp_path) == []
+        
+        assert backend.write_stream(file_path, [b'complete']) == 8
+        assert os.listdir(tmp_path) == ["page.png"]
+
+    def test_write_bytes_replaces_file(self, tmp_path):
+        """Test raw byte writes replace any previous file content"""
+        from langchain_scrapingbee.tools import _write_bytes
+        
+        file_path = tmp_path / "results.json"
+        file_path.write_bytes(b'{"stale": "content that is longer"}')
+        _write_bytes(str(file_path), b'{"fresh": 1}')
+        
+        assert file_path.read_bytes() == b'{"fresh": 1}'
+
+    def test_get_extension_from_content_type(self):
+        """Test file extensions are looked up from the media type"""
+        assert ScrapeUrlTool._get_extension_from_content_type("image/png") == "png"
+        assert ScrapeUrlTool._get_extension_from_content_type("Image/JPEG; charset=binary") == "jpg"
+        assert ScrapeUrlTool._get_extension_from_content_type("application/pdf") == "pdf"
+        assert ScrapeUrlTool._get_extension_from_content_type("text/html; charset=utf-8") == "bin"
+
+    def test_create_results_folder_per_call(self, tmp_path):
+        """Test calls at different times get their own folders, so results never overwrite each other"""
+        from langchain_scrapingbee.tools import create_results_folder
+        
+        with patch('langchain_scrapingbee.tools.datetime.datetime') as mock_datetime:
+            mock_datetime.now.return_value.strftime.side_effect = ["20260101_120000", "20260101_120001"]
+            first = create_results_folder(str(tmp_path))
+            second = create_results_folder(str(tmp_path))
+        
+        assert first == str(tmp_path / "20260101_120000")
+        assert second == str(tmp_path / "20260101_120001")
+        assert os.path.isdir(first) and os.path.isdir(second)
+
+    def test_scraping_prompt_loaded_from_package(self):
+        """Test the ScrapeUrlTool description is read from the packaged prompt file"""
+        tool = ScrapeUrlTool(api_key="test_api_key")
+        
+        assert tool.description.startswith("Scrapes web content")
+        assert "SUPPORTED PARAMS:" in tool.description
+
+    def test_save_scraping_metadata_concurrent(self, tmp_path):
+        """Test concurrent appends across folders produce whole, uninterleaved lines"""
+        from langchain_scrapingbee.tools import save_scraping_metadata
+        
+        folders = [tmp_path / f"run_{i}" for i in range(20)]
+        for folder in folders:
+            folder.mkdir()
+        
+        def append(i):
+            save_scraping_metadata(str(folders[i % 20]), f"https://example.com/{i}", {"i": i}, "text")
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(append, range(200)))
+        
+        for folder in folders:
+            with open(folder / "scraping_metadata.jsonl", encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+            assert len(records) == 10
+
+    def test_parse_urlparams(self):
+        """Test URL-style params parsing edge cases"""
+        from langchain_scrapingbee.tools import _parse_urlparams
+        
+        assert _parse_urlparams("a=b=c&flag&y=1&z=TRUE&=x&empty=") == {
+            "a": "b=c", "y": 1, "z": True, "": "x", "empty": ""
+        }
+
+    def test_is_binary(self):
+        """Test binary detection from the media type and screenshot params"""
+        tool = ScrapeUrlTool(api_key="test_api_key")
+        
+        assert tool._is_binary("IMAGE/PNG", {})
+        assert tool._is_binary("application/pdf; qs=0.001", {})
+        assert tool._is_binary("application/octet-stream", {})
+        assert tool._is_binary("binary/octet-stream", {})  # S3's default for uploads
+        assert tool._is_binary("text/html", {"screenshot_full_page": True})
+        assert not tool._is_binary("text/html; charset=image/png", {"screenshot": False})
+
+    def test_warm_up_session_once(self, no_warm_up):
+        """Test tools warm up only when asked, sending one HEAD per process and swallowing any error"""
+        import threading
+        Thread = threading.Thread
+        threads = []
+        
+        def start_thread(*args, **kwargs):
+            threads.append(Thread(*args, **kwargs))
+            return threads[-1]
+        
+        ScrapeUrlTool(api_key="test_api_key")
+        no_warm_up.assert_not_called()
+        ScrapeUrlTool(api_key="test_api_key", warm_up=True)
+        no_warm_up.assert_called_once()
+        
+        # e.g. pytest-socket's SocketBlockedError, which is a RuntimeError
+        with patch('langchain_scrapingbee.tools._warm_up_started', False), \
+             patch('langchain_scrapingbee.tools.threading.Thread', side_effect=start_thread), \
+             patch('langchain_scrapingbee.tools._SESSION.head', side_effect=RuntimeError("socket blocked")) as mock_head, \
+             patch('threading.excepthook') as mock_excepthook:
+            _warm_up_session()
+            _warm_up_session()
+            for thread in threads:
+                thread.join()
+        
+        assert len(threads) == 1
+        mock_head.assert_called_once_with("https://app.scrapingbee.com/", timeout=5)
+        mock_excepthook.assert_not_called()